@@ -1,5 +1,7 @@
 import os
-import requests
+import json
+import httpx
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import quote
 from time import sleep
 
@@ -12,9 +14,22 @@ BADGES = [
 ]
 
 STYLE = "for-the-badge"
+MAX_WORKERS = 8
 ATTEMPTS = 3
 TIMEOUT = 15
-SLEEP_BETWEEN = 1.0  # seconds between retries
+SLEEP_BETWEEN = 1.0  # seconds before the first retry, doubled after each
+
+# one HTTP/2 client for every badge: all downloads are multiplexed as
+# concurrent streams over a single TCP+TLS connection to img.shields.io
+CLIENT = httpx.Client(
+    http2=True,
+    timeout=TIMEOUT,
+    limits=httpx.Limits(max_connections=MAX_WORKERS, max_keepalive_connections=MAX_WORKERS),
+    headers={
+        "User-Agent": "python-httpx/BadgesDownloader/1.0",
+        "Accept": "image/svg+xml, */*"
+    },
+)
 
 def shields_url(label, message, color, style, logo=None, fmt="svg"):
     qlabel = quote(label)
@@ -23,35 +38,107 @@ def shields_url(label, message, color, style, logo=None, fmt="svg"):
         return f"https://img.shields.io/badge/{qlabel}-{qmessage}-{color}?style={style}&logo={logo}&logoColor=white&format={fmt}"
     return f"https://img.shields.io/badge/{qlabel}-{qmessage}-{color}?style={style}&format={fmt}"
 
+# (badge, url, out_path) for every badge, built once at import
+TASKS = [
+    (b,
+     shields_url(b["label"], b["message"], b["color"], STYLE, logo=b.get("logo"), fmt="svg"),
+     os.path.join(output_dir, f"{b['filename']}.svg"))
+    for b in BADGES
+]
+
+def _meta_path(out_path):
+    return os.path.splitext(out_path)[0] + ".meta.json"
+
+def _load_meta(out_path):
+    # validators are only useful if the file they describe is still on disk
+    if not os.path.exists(out_path):
+        return {}
+    try:
+        with open(_meta_path(out_path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_meta(out_path, headers):
+    with open(_meta_path(out_path), "w", encoding="utf-8") as f:
+        json.dump({
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }, f)
+
+def _unchanged_by_head(url, out_path, timeout):
+    # a HEAD is enough to tell whether a badge on disk without stored
+    # validators is current: compare the uncompressed size, then remember
+    # the validators so later runs can use conditional GETs
+    # the HEAD is only a shortcut: on any problem with it, fall back to the GET
+    try:
+        h = CLIENT.head(url, headers={"Accept-Encoding": "identity"},
+                        timeout=timeout, follow_redirects=True)
+        length = h.headers.get("Content-Length")
+        if not h.is_success or length is None or int(length) != os.path.getsize(out_path):
+            return False
+    except (httpx.HTTPError, ValueError):
+        return False
+    _save_meta(out_path, h.headers)
+    return True
+
 def download_file(url, out_path, timeout=TIMEOUT):
-    headers = {
-        "User-Agent": "python-requests/BadgesDownloader/1.0",
-        "Accept": "image/svg+xml, */*"
-    }
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    resp.raise_for_status()
-    content = resp.content
-    # Basic SVG sanity check (look for '<svg' near start)
-    head = content[:512].lower()
-    if b"<svg" not in head and not head.strip().startswith(b"<?xml"):
-        raise ValueError("Downloaded content does not look like an SVG")
-    with open(out_path, "wb") as f:
-        f.write(content)
+    # returns False when the file on disk is kept (304 or matching HEAD)
+    meta = _load_meta(out_path)
+    if not meta and os.path.exists(out_path) and _unchanged_by_head(url, out_path, timeout):
+        return False
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    with CLIENT.stream("GET", url, headers=headers, timeout=timeout) as resp:
+        if resp.status_code == 304:
+            return False
+        resp.raise_for_status()
+        # Basic SVG sanity check on the first 512 bytes only, so an HTML
+        # error page is rejected before the rest of the body is read
+        chunks = resp.iter_bytes()
+        head = b""
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= 512:
+                break
+        if b"<svg" not in head[:512].lower() and not head.lstrip().startswith(b"<?xml"):
+            raise ValueError("Downloaded content does not look like an SVG")
+        # write to a temp file so a dropped connection never leaves a
+        # truncated SVG behind that the cached ETag would then vouch for
+        part_path = out_path + ".part"
+        try:
+            with open(part_path, "wb") as f:
+                f.write(head)
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(part_path, out_path)
+        except BaseException:
+            # don't leave a half-written .part file behind
+            try:
+                os.unlink(part_path)
+            except FileNotFoundError:
+                pass
+            raise
+    _save_meta(out_path, resp.headers)
+    return True
 
-def fetch_badge(b):
-    url = shields_url(b["label"], b["message"], b["color"], STYLE, logo=b.get("logo"), fmt="svg")
-    out_path = os.path.join(output_dir, f"{b['filename']}.svg")
+def fetch_badge(b, url, out_path):
     for i in range(1, ATTEMPTS + 1):
         try:
             print(f"[{i}/{ATTEMPTS}] Downloading: {b['filename']} <- {url}")
-            download_file(url, out_path)
+            if not download_file(url, out_path):
+                print(f"Unchanged: {out_path}")
+                return True
             size = os.path.getsize(out_path)
             print(f"Saved: {out_path} ({size} bytes)")
             return True
         except Exception as e:
             print(f"Attempt {i} for {b['filename']} failed: {e}")
             if i < ATTEMPTS:
-                sleep(SLEEP_BETWEEN)
+                sleep(SLEEP_BETWEEN * 2 ** (i - 1))
     # fallback: create small metadata file so LaTeX won't fail with missing file
     txt_path = os.path.join(output_dir, f"{b['filename']}.txt")
     with open(txt_path, "w", encoding="utf-8") as f:
@@ -61,9 +148,12 @@ def fetch_badge(b):
 
 def main():
     results = {}
-    for b in BADGES:
-        ok = fetch_badge(b)
-        results[b["filename"]] = ok
+    # downloads are network-bound, so a small thread pool overlaps their waits;
+    # the workers share CLIENT's HTTP/2 connection
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(TASKS)))) as ex:
+        fut_to_b = {ex.submit(fetch_badge, *task): task[0] for task in TASKS}
+        for fut in as_completed(fut_to_b):
+            results[fut_to_b[fut]["filename"]] = fut.result()
     print("Summary:")
     for name, ok in results.items():
         print(f" - {name}: {'OK' if ok else 'FAILED (fallback)'}")
@@ -5,23 +5,23 @@ Tailors LaTeX CV based on job postings using GPT-4o-mini
 """
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 from pathlib import Path
 from typing import Optional
 
 from src.config_manager import ConfigManager
-from src.job_analyzer import JobAnalyzer
-from src.cv_generator import CVGenerator
 from src.logger import setup_logger
 from src.utils import (
     validate_job_posting,
     read_file,
     sanitize_filename,
     format_confidence,
-    ensure_directory
+    ensure_directory,
+    load_env
 )
 
+# Load OPENAI_API_KEY from .env once at startup
+load_env()
+
 # Initialize logger
 logger = setup_logger("cv_automation", "INFO")
 
@@ -31,6 +31,11 @@ console = Console()
 
 def initialize_system():
     """Initialize configuration and components."""
+    # Imported here so commands that don't need them (setup, info) skip
+    # loading the OpenAI client and the LaTeX generator
+    from src.job_analyzer import JobAnalyzer
+    from src.cv_generator import CVGenerator
+
     try:
         logger.info("Initializing CV automation system...")
         config = ConfigManager()
@@ -88,8 +93,12 @@ def test_api():
 
     try:
         config, analyzer, _ = initialize_system()
+        try:
+            connected = analyzer.test_connection()
+        finally:
+            analyzer.close()
 
-        if analyzer.test_connection():
+        if connected:
             console.print("[green]API connection successful![/green]")
             console.print(f"[dim]Using model: {analyzer.model}[/dim]")
             console.print("[dim]Estimated cost per analysis: ~$0.002[/dim]")
@@ -110,6 +119,8 @@ def generate(
     auto: bool = typer.Option(False, "--auto", "-a", help="Auto-accept AI recommendation"),
 ):
     """Generate tailored CV from job posting."""
+    from rich.panel import Panel
+    from rich.table import Table
 
     # Validate input file
     if not validate_job_posting(job):
@@ -130,6 +141,8 @@ def generate(
     except Exception as e:
         console.print(f"[red]Error analyzing job posting: {e}[/red]")
         raise typer.Exit(1)
+    finally:
+        analyzer.close()
 
     # Display results
     language_display = "Spanish" if analysis.get('language', 'en') == 'es' else "English"
@@ -266,6 +279,7 @@ def test():
             console.print("[green]  PASSED[/green]")
         except Exception as e:
             console.print(f"[red]  FAILED: {e}[/red]")
+    analyzer.close()
 
     console.print("\n[green]Test suite complete![/green]")
 
@@ -273,7 +287,16 @@ def test():
 @app.command()
 def info():
     """Show system information and configuration."""
-    config, _, _ = initialize_system()
+    from rich.panel import Panel
+    from rich.table import Table
+
+    # Only the configuration is needed here, not the API client
+    try:
+        config = ConfigManager()
+    except Exception as e:
+        logger.error(f"Error loading configuration: {e}", exc_info=True)
+        console.print(f"[red]Error loading configuration: {e}[/red]")
+        raise typer.Exit(1)
 
     console.print(Panel.fit(
         "[bold]CV Automation System Info[/bold]\n\n"
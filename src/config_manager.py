@@ -1,8 +1,27 @@
 """Configuration management for CV automation system."""
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List
 
+try:
+    # libyaml-backed loader, much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+@lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized on its path and modification time.
+
+    The returned dict is shared between ConfigManager instances and must
+    be treated as read-only.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_Loader)
+
 
 class ConfigManager:
     """Manages configuration files for CV automation."""
@@ -16,8 +35,8 @@ class ConfigManager:
         """Load YAML configuration file."""
         config_path = self.config_dir / filename
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+            mtime = config_path.stat().st_mtime
+            return _load_yaml_cached(str(config_path), mtime)
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         except yaml.YAMLError as e:
@@ -43,6 +62,10 @@ class ConfigManager:
         """Get the job analysis prompt template."""
         return self.prompts.get("job_analysis_prompt", "")
 
+    def get_batch_analysis_prompt(self) -> str:
+        """Get the prompt template for analyzing several job postings at once."""
+        return self.prompts.get("batch_job_analysis_prompt", "")
+
     def get_fallback_title(self, category: str = "default") -> str:
         """Get fallback job title."""
         return self.prompts.get("fallback_titles", {}).get(category, "Software Engineer")
@@ -1,10 +1,55 @@
 """CV generator that updates LaTeX files based on job analysis."""
+import errno
+import os
 import re
+import shutil
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 from .config_manager import ConfigManager
 
+# An edit takes a file's content and returns the updated content, or None on failure
+Edit = Callable[[str], Optional[str]]
+
+# LaTeX patterns that don't depend on the config, compiled once at import
+_JOBTITLE_RE = re.compile(r'(\\newcommand\{\\jobtitle\}\{)([^}]+)(\})')
+_ATSBOOST_RE = re.compile(r'(\\atsboost\{)(.*?)(\})', re.DOTALL)
+# Flag block in main.tex: last flag declaration, activation lines, preamble input
+_FLAG_BLOCK_RE = re.compile(
+    r'(\\newif\\ifES[^\n]*\n)(.*?)(\\input\{setup/preamble\.tex\})', re.DOTALL
+)
+
+# Marker in sidebar.tex replaced with the job's keywords
+KEYWORDS_PLACEHOLDER = 'KEYWORDS_PLACEHOLDER'
+
+# Scratch directory for pdflatex/latexmk output
+BUILD_DIR = Path('build')
+
+# Attempts to move the finished PDF while the target is locked
+MOVE_ATTEMPTS = 5
+
+# Auxiliary files left behind by pdflatex/latexmk (plus *.synctex.gz)
+LATEX_ARTIFACT_SUFFIXES = {'.aux', '.log', '.out', '.toc', '.fdb_latexmk', '.fls', '.blg', '.bbl'}
+
+
+_print_lock = threading.Lock()
+
+
+def _report(message: str) -> None:
+    """Print a progress message without interleaving output from worker threads."""
+    with _print_lock:
+        print(message)
+
+
+@lru_cache(maxsize=None)
+def _which(tool: str) -> Optional[str]:
+    """Locate a LaTeX tool on PATH once per process."""
+    return shutil.which(tool)
+
 
 class CVGenerator:
     """Generates tailored CVs by modifying LaTeX files."""
@@ -13,52 +58,28 @@ class CVGenerator:
         self.config = config_manager
         self.file_targets = config_manager.get_file_targets()
 
-    def update_header_title(self, role_title: str) -> bool:
-        """Update job title in sections/header.tex and setup job title variable."""
-        header_path = Path(self.file_targets['header_file'])
-        macros_path = Path("setup/macros.tex")
-
-        try:
-            # Update header title (existing logic)
-            with open(header_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            pattern = self.file_targets['header_title_pattern']
-            replacement = f'\\1{role_title}\\3'
-
-            if not re.search(pattern, content):
-                print(f"Warning: Could not find header title pattern in {header_path}")
-                return False
-
-            content = re.sub(pattern, replacement, content)
+        # The header pattern comes from the config, so compile it per instance
+        self._header_re = re.compile(self.file_targets['header_title_pattern'])
 
-            with open(header_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+        # Version/language activation lines (e.g. \Gamingtrue, \EStrue) in main.tex
+        tex_flags = {name: data.get('tex_flag', name) for name, data in config_manager.get_all_versions().items()}
+        self._flag_true_re = re.compile(
+            r'^\\(?:' + '|'.join(map(re.escape, [*tex_flags.values(), 'ES'])) + r')true[ \t]*(?:\r?\n|\Z)',
+            re.MULTILINE
+        )
 
-            # NEW: Update job title variable in macros.tex
-            with open(macros_path, 'r', encoding='utf-8') as f:
-                macros_content = f.read()
+        # The versions and languages are known up front, so build every
+        # activation block once instead of on each update
+        self._flag_blocks = {
+            (version, language): self._build_flag_block(tex_flag, language)
+            for version, tex_flag in tex_flags.items()
+            for language in ('en', 'es')
+        }
 
-            # Pattern to match: \newcommand{\jobtitle}{Data Analyst}
-            title_pattern = r'(\\newcommand\{\\jobtitle\}\{)([^}]+)(\})'
-            title_replacement = f'\\1{role_title}\\3'
-
-            if re.search(title_pattern, macros_content):
-                macros_content = re.sub(title_pattern, title_replacement, macros_content)
-                
-                with open(macros_path, 'w', encoding='utf-8') as f:
-                    f.write(macros_content)
-                
-                print(f"Updated job title variable: {role_title}")
-            else:
-                print("Warning: Could not find job title variable in macros.tex")
+    def update_header_title(self, role_title: str) -> bool:
+        """Update job title in sections/header.tex and setup job title variable."""
+        return self._apply_all_edits(self._header_title_edits(role_title))
 
-            return True
-            
-        except Exception as e:
-            print(f"Error updating header title: {e}")
-            return False
-        
     def update_version_flags(self, version: str, language: str = 'en') -> bool:
         """
         Update CV version flags and language flag in main.tex.
@@ -70,153 +91,255 @@ class CVGenerator:
         Returns:
             True if successful, False otherwise
         """
-        main_path = Path(self.file_targets['main_file'])
+        return self._apply_all_edits(self._version_flag_edits(version, language))
 
-        try:
-            with open(main_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # Find the flag lines (should be around lines 3-8)
-            updated_lines = []
-            flag_section = False
-
-            for line in lines:
-                # Detect flag section
-                if '\\newif\\ifFAANG' in line:
-                    flag_section = True
-                elif flag_section and '\\input{setup/preamble.tex}' in line:
-                    flag_section = False
-
-                # Reset all flags to false in flag section
-                if flag_section:
-                    if '\\newif\\if' in line:
-                        updated_lines.append(line)
-                    elif 'true' in line.lower():
-                        # This is a flag activation line - comment it out
-                        continue
-                else:
-                    updated_lines.append(line)
+    def update_ats_boost(self, ats_text: str, keywords: list = None) -> bool:
+        """Update ATS boost text and keywords in sections/sidebar.tex."""
+        return self._apply_all_edits(self._ats_boost_edits(ats_text, keywords))
 
-            # Find where to insert flags (after \newif\ifES which is after \newif\ifGaming)
-            insert_index = None
-            for i, line in enumerate(updated_lines):
-                if '\\newif\\ifES' in line:
-                    insert_index = i + 1
-                    break
+    def generate_cv(self, analysis_result: Dict, output_name: Optional[str] = None) -> bool:
+        """Generate complete CV by updating all files."""
+        language = analysis_result.get('language', 'en')  # Default to English
 
-            if insert_index is not None:
-                # Insert version flag
-                updated_lines.insert(insert_index, f'\\{version}true\n')
-                # Insert language flag if Spanish
-                if language == 'es':
-                    updated_lines.insert(insert_index + 1, '\\EStrue\n')
-                    print(f"Language flag set: Spanish")
-                else:
-                    print(f"Language flag set: English (default)")
-            else:
-                print("Warning: Could not find flag declaration section")
-                return False
+        # Collect every edit first so each target file is read and written once
+        edits_by_file: Dict[Path, List[Edit]] = {}
+        for edits in (
+            self._header_title_edits(analysis_result['role']),
+            self._ats_boost_edits(
+                analysis_result['ats_text'],
+                analysis_result.get('keywords', [])  # Pass the extracted keywords
+            ),
+            self._version_flag_edits(analysis_result['version'], language),
+        ):
+            for path, file_edits in edits.items():
+                edits_by_file.setdefault(path, []).extend(file_edits)
 
-            with open(main_path, 'w', encoding='utf-8') as f:
-                f.writelines(updated_lines)
+        return self._apply_all_edits(edits_by_file)
 
-            return True
+    def _apply_all_edits(self, edits_by_file: Dict[Path, List[Edit]]) -> bool:
+        """
+        Apply edits to their target files with a single read/write per file.
 
-        except FileNotFoundError:
-            print(f"Error: Main file not found: {main_path}")
-            return False
-        except Exception as e:
-            print(f"Error updating version flags: {e}")
-            return False
+        Each edit takes the file content and returns the updated content,
+        or None if it could not be applied. The files are disjoint, so
+        they are updated concurrently.
 
-    def generate_cv(self, analysis_result: Dict, output_name: Optional[str] = None) -> bool:
-        """Generate complete CV by updating all files."""
+        Returns:
+            True if every edit was applied, False otherwise
+        """
+        if len(edits_by_file) <= 1:
+            results = [self._apply_file_edits(path, edits) for path, edits in edits_by_file.items()]
+        else:
+            with ThreadPoolExecutor(max_workers=len(edits_by_file)) as executor:
+                results = list(executor.map(self._apply_file_edits, edits_by_file.keys(), edits_by_file.values()))
+
+        return all(results)
+
+    def _apply_file_edits(self, path: Path, edits: List[Edit]) -> bool:
+        """Read one file, apply its edits in order and write it back if changed."""
         success = True
 
-        # Update header title
-        if not self.update_header_title(analysis_result['role']):
-            print("Failed to update header title")
-            success = False
+        try:
+            original = path.read_text(encoding='utf-8')
 
-        # Update ATS boost WITH keywords
-        if not self.update_ats_boost(
-            analysis_result['ats_text'],
-            analysis_result.get('keywords', [])  # Pass the extracted keywords
-        ):
-            print("Failed to update ATS boost text")
-            success = False
+            content = original
+            for edit in edits:
+                updated = edit(content)
+                if updated is None:
+                    success = False
+                else:
+                    content = updated
 
-        # Update version flags and language flag
-        language = analysis_result.get('language', 'en')  # Default to English
-        if not self.update_version_flags(analysis_result['version'], language):
-            print("Failed to update version flags")
+            if content != original:
+                path.write_text(content, encoding='utf-8')
+
+        except FileNotFoundError:
+            _report(f"Error: File not found: {path}")
+            success = False
+        except Exception as e:
+            _report(f"Error updating {path}: {e}")
             success = False
 
         return success
 
+    def _header_title_edits(self, role_title: str) -> Dict[Path, List[Edit]]:
+        """Build the edits that set the job title in the header and macros."""
+        header_path = Path(self.file_targets['header_file'])
+        macros_path = Path("setup/macros.tex")
+
+        def set_header_title(content: str) -> Optional[str]:
+            content, count = self._header_re.subn(
+                lambda m: m.group(1) + role_title + m.group(3), content, count=1
+            )
+            if count == 0:
+                _report(f"Warning: Could not find header title pattern in {header_path}")
+                return None
+            return content
+
+        def set_job_title_variable(content: str) -> Optional[str]:
+            # Pattern to match: \newcommand{\jobtitle}{Data Analyst}
+            # A plain substring search finds the anchor (or its absence)
+            # cheaply; the regex then only runs from that position.
+            start = content.find('\\newcommand{\\jobtitle}')
+            match = _JOBTITLE_RE.search(content, start) if start >= 0 else None
+            if match is None:
+                _report("Warning: Could not find job title variable in macros.tex")
+                return content
+            _report(f"Updated job title variable: {role_title}")
+            return content[:match.start(2)] + role_title + content[match.end(2):]
+
+        return {header_path: [set_header_title], macros_path: [set_job_title_variable]}
+
+    def _version_flag_edits(self, version: str, language: str) -> Dict[Path, List[Edit]]:
+        """Build the edit that activates the version and language flags in main.tex."""
+        main_path = Path(self.file_targets['main_file'])
+
+        def set_flags(content: str) -> Optional[str]:
+            flags = self._flag_blocks.get((version, language))
+            if flags is None:
+                flags = self._build_flag_block(version, language)
+
+            # Rewrite the block between \newif\ifES and the preamble input in
+            # one pass: new flags first, previously activated flags dropped
+            content, count = _FLAG_BLOCK_RE.subn(
+                lambda m: m.group(1) + flags + self._flag_true_re.sub('', m.group(2)) + m.group(3),
+                content, count=1
+            )
+            if count == 0:
+                _report("Warning: Could not find flag declaration section")
+                return None
+
+            if language == 'es':
+                _report("Language flag set: Spanish")
+            else:
+                _report("Language flag set: English (default)")
+            return content
+
+        return {main_path: [set_flags]}
+
+    @staticmethod
+    def _build_flag_block(tex_flag: str, language: str) -> str:
+        """Build the activation lines for a version flag and language."""
+        block = f'\\{tex_flag}true\n'
+        if language == 'es':
+            block += '\\EStrue\n'
+        return block
+
+    def _ats_boost_edits(self, ats_text: str, keywords: list = None) -> Dict[Path, List[Edit]]:
+        """Build the edits that set the ATS boost text and keywords in the sidebar."""
+        sidebar_path = Path(self.file_targets['sidebar_file'])
+
+        def set_ats_text(content: str) -> Optional[str]:
+            # Replace first atsboost (main text), locating it with a
+            # substring search before running the regex
+            start = content.find('\\atsboost{')
+            match = _ATSBOOST_RE.search(content, start) if start >= 0 else None
+            if match is None:
+                _report(f"Warning: Could not find \\atsboost pattern in {sidebar_path}")
+                return None
+            _report(f"Successfully updated ATS boost text ({len(ats_text)} chars)")
+            return content[:match.start(2)] + ats_text + content[match.end(2):]
+
+        def set_keywords(content: str) -> Optional[str]:
+            # Replace KEYWORDS_PLACEHOLDER with job-specific keywords
+            if not keywords:
+                return content
+            start = content.find(KEYWORDS_PLACEHOLDER)
+            if start < 0:
+                return content
+
+            # Format keywords as comma-separated string
+            keyword_text = ', '.join(keywords[:15])  # Limit to 15 keywords
+            # Only the text after the first hit still needs scanning
+            end = start + len(KEYWORDS_PLACEHOLDER)
+            content = (content[:start] + keyword_text
+                       + content[end:].replace(KEYWORDS_PLACEHOLDER, keyword_text))
+            _report(f"Updated keyword placeholder with {len(keywords)} keywords")
+            return content
+
+        return {sidebar_path: [set_ats_text, set_keywords]}
+
     def compile_pdf(self, output_name: Optional[str] = None) -> bool:
         """
         Compile LaTeX to PDF using pdflatex with automatic cleanup.
+
+        All intermediate files are written to the build/ directory; the
+        finished PDF is moved to output/<output_name>.pdf, or to main.pdf
+        in the project root if no output name is given.
         """
         try:
             # Step 1: Clean up any existing main.pdf first
+            BUILD_DIR.mkdir(exist_ok=True)
             self._cleanup_main_pdf()
             
             # Step 2: Check if pdflatex is available
-            result = subprocess.run(
-                ['pdflatex', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode != 0:
+            if _which('pdflatex') is None:
                 print("Error: pdflatex not found. Please ensure MiKTeX is installed.")
                 return False
 
-            # Step 3: Compile LaTeX (run twice for references)
-            for i in range(2):
+            # Step 3: Compile LaTeX, re-running only while references change.
+            # pdflatex's console output is discarded; everything it prints
+            # also goes to build/main.log, which is read only when needed.
+            if _which('latexmk'):
+                # latexmk decides how many pdflatex passes are needed
                 result = subprocess.run(
-                    ['pdflatex', '-interaction=nonstopmode', 'main.tex'],
-                    capture_output=True,
+                    ['latexmk', '-pdf', '-f', '-interaction=nonstopmode', f'-outdir={BUILD_DIR}', 'main.tex'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
-                    timeout=60
+                    timeout=120
                 )
+            else:
+                for _ in range(2):
+                    result = subprocess.run(
+                        ['pdflatex', '-interaction=nonstopmode', f'-output-directory={BUILD_DIR}', 'main.tex'],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                        timeout=60
+                    )
+                    if 'Rerun to get' not in self._read_build_log():
+                        break
+
+            # Check if PDF was created
+            source_pdf = BUILD_DIR / 'main.pdf'
+            if not source_pdf.exists():
+                print("LaTeX compilation failed:")
+                print(self._read_build_log(tail=40) or result.stderr)
+                return False
 
-                # Check if PDF was created
-                if not Path('main.pdf').exists():
-                    print("LaTeX compilation failed:")
-                    print(result.stdout)
-                    return False
-
-            # Step 4: Move PDF to output directory with retry logic
+            # Step 4: Move PDF out of the build directory with retry logic
             if output_name:
                 output_dir = Path('output')
-                output_dir.mkdir(exist_ok=True)
-
-                source_pdf = Path('main.pdf')
-                if source_pdf.exists():
-                    target_pdf = output_dir / f"{output_name}.pdf"
-                    
-                    # Retry logic for file move
-                    for attempt in range(3):
+                output_dir.mkdir(parents=True, exist_ok=True)
+                target_pdf = output_dir / f"{output_name}.pdf"
+            else:
+                target_pdf = Path('main.pdf')
+
+            # Retry logic for file move: a PDF viewer holding the target open
+            # usually lets go quickly, so back off 0.1s, 0.2s, 0.4s, ...
+            for attempt in range(MOVE_ATTEMPTS):
+                try:
+                    self._move_pdf(source_pdf, target_pdf)
+                    print(f"PDF generated: {target_pdf}")
+                    break
+                except PermissionError as e:
+                    if attempt < MOVE_ATTEMPTS - 1:
+                        print(f"File locked, waiting... (attempt {attempt + 1}/{MOVE_ATTEMPTS})")
+                        time.sleep(0.1 * 2 ** attempt)
+                    else:
+                        print(f"Error: Could not move PDF after {MOVE_ATTEMPTS} attempts. {e}")
+                        # build/ is removed by cleanup_latex_artifacts, so
+                        # keep the PDF in the project root instead
+                        fallback_pdf = Path('main.pdf')
+                        if target_pdf == fallback_pdf:
+                            return False
                         try:
-                            # Remove target if it exists
-                            if target_pdf.exists():
-                                target_pdf.unlink()
-                            
-                            source_pdf.rename(target_pdf)
-                            print(f"PDF generated: {target_pdf}")
-                            break
-                        except PermissionError as e:
-                            if attempt < 2:  # Try 3 times total
-                                print(f"File locked, waiting... (attempt {attempt + 1}/3)")
-                                import time
-                                time.sleep(2)  # Wait 2 seconds and try again
-                            else:
-                                print(f"Error: Could not move PDF after 3 attempts. {e}")
-                                print("The PDF was generated as 'main.pdf' in the project root.")
-                                return True  # Still successful, just not moved
+                            self._move_pdf(source_pdf, fallback_pdf)
+                        except OSError:
+                            return False
+                        print(f"The PDF was generated as '{fallback_pdf}'.")
+                        return True  # Still successful, just not moved
 
             return True
 
@@ -230,9 +353,31 @@ class CVGenerator:
             print(f"Error compiling PDF: {e}")
             return False
 
+    @staticmethod
+    def _move_pdf(source_pdf: Path, target_pdf: Path) -> None:
+        """Move the compiled PDF, overwriting an existing target."""
+        try:
+            # Atomically overwrites an existing target
+            os.replace(source_pdf, target_pdf)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # output/ lives on another filesystem
+            shutil.move(str(source_pdf), str(target_pdf))
+
+    def _read_build_log(self, tail: Optional[int] = None) -> str:
+        """Read build/main.log, optionally only its last `tail` lines."""
+        try:
+            log = (BUILD_DIR / 'main.log').read_text(encoding='utf-8', errors='replace')
+        except FileNotFoundError:
+            return ''
+        if tail is not None:
+            log = '\n'.join(log.splitlines()[-tail:])
+        return log
+
     def _cleanup_main_pdf(self):
-        """Clean up main.pdf before compilation with retry logic."""
-        main_pdf = Path('main.pdf')
+        """Clean up build/main.pdf before compilation with retry logic."""
+        main_pdf = BUILD_DIR / 'main.pdf'
         if main_pdf.exists():
             for attempt in range(3):
                 try:
@@ -242,7 +387,6 @@ class CVGenerator:
                 except PermissionError:
                     if attempt < 2:
                         print(f"main.pdf is locked, waiting... (attempt {attempt + 1}/3)")
-                        import time
                         time.sleep(2)
                     else:
                         print("Warning: Could not delete main.pdf (file may be open in PDF viewer)")
@@ -251,52 +395,16 @@ class CVGenerator:
 
     def cleanup_latex_artifacts(self):
         """Remove LaTeX auxiliary files."""
-        artifacts = [
-            '*.aux', '*.log', '*.out', '*.toc', '*.fdb_latexmk',
-            '*.fls', '*.synctex.gz', '*.blg', '*.bbl'
-        ]
-
-        for pattern in artifacts:
-            for file in Path('.').glob(pattern):
+        # Everything compile_pdf produced lives in build/
+        shutil.rmtree(BUILD_DIR, ignore_errors=True)
+
+        # Stray artifacts from compiling main.tex in place (e.g. from an editor),
+        # found with one directory scan instead of a glob per artifact type
+        for entry in os.scandir('.'):
+            name = entry.name
+            if entry.is_file() and (os.path.splitext(name)[1] in LATEX_ARTIFACT_SUFFIXES
+                                    or name.endswith('.synctex.gz')):
                 try:
-                    file.unlink()
-                except Exception:
+                    os.unlink(entry.path)
+                except OSError:
                     pass
-
-          
-    def update_ats_boost(self, ats_text: str, keywords: list = None) -> bool:
-        """Update ATS boost text and keywords in sections/sidebar.tex."""
-        sidebar_path = Path(self.file_targets['sidebar_file'])
-
-        try:
-            with open(sidebar_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # 1. Update main ATS boost text (existing logic)
-            pattern = r'(\\atsboost\{)(.*?)(\})'
-            replacement = f'\\1{ats_text}\\3'
-
-            if not re.search(pattern, content, re.DOTALL):
-                print(f"Warning: Could not find \\atsboost pattern in {sidebar_path}")
-                return False
-
-            # Replace first atsboost (main text)
-            content = re.sub(pattern, replacement, content, count=1, flags=re.DOTALL)
-
-            # 2. NEW: Replace KEYWORDS_PLACEHOLDER with job-specific keywords
-            if keywords and 'KEYWORDS_PLACEHOLDER' in content:
-                # Format keywords as comma-separated string
-                keyword_text = ', '.join(keywords[:15])  # Limit to 15 keywords
-                content = content.replace('KEYWORDS_PLACEHOLDER', keyword_text)
-                print(f"Updated keyword placeholder with {len(keywords)} keywords")
-
-            # 3. Write updated content
-            with open(sidebar_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            print(f"Successfully updated ATS boost text ({len(ats_text)} chars)")
-            return True
-            
-        except Exception as e:
-            print(f"Error updating ATS boost: {e}")
-            return False
\ No newline at end of file
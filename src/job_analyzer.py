@@ -1,30 +1,137 @@
 """Job posting analyzer using OpenAI GPT-4o-mini."""
+import asyncio
+import hashlib
+import json
+import logging
 import os
-from openai import OpenAI
-from typing import Dict, List
-from dotenv import load_dotenv
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+from typing import Dict, List, Optional, Tuple
 from .config_manager import ConfigManager
-from .utils import parse_ai_response, validate_version, detect_language, extract_company_from_email
+from .utils import parse_ai_response, parse_ai_batch_response, validate_version, detect_language, extract_company_from_email, load_env
 from .logger import get_logger
 
+try:
+    # optional: scores every CV version in one pass over the posting
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = get_logger(__name__)
 
+# Upper bound on concurrent API requests made by analyze_many
+MAX_CONCURRENT_REQUESTS = 5
+
+# Larger keep-alive pools over HTTP/2 so concurrent and bulk requests
+# reuse connections instead of waiting on the SDK's default pool
+POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Postings sent per analysis request; bounds max_tokens, which grows
+# with the number of postings, well below the model's output limit
+MAX_BATCH_SIZE = 10
+
+# Output budget per posting: a JSON object with 15-20 keywords and a
+# ~150-word ATS text, with headroom for Spanish, which needs more tokens
+MAX_TOKENS_PER_POSTING = 600
+
+# Analyses of previously seen postings are kept on disk for 30 days
+CACHE_DIR = Path("cache/job_analyzer")
+CACHE_TTL = 30 * 86400
+
+# Batch API jobs are polled at this interval until they finish
+BATCH_POLL_INTERVAL = 30
+BATCH_FINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Common technical keywords picked out by the fallback analysis
+COMMON_KEYWORDS = [
+    'python', 'javascript', 'java', 'aws', 'docker', 'kubernetes',
+    'sql', 'api', 'react', 'node', 'machine learning', 'data',
+    'cloud', 'microservices', 'agile', 'ci/cd', 'git', 'rest',
+    'backend', 'frontend', 'full-stack', 'database', 'linux'
+]
+_KW_RE = re.compile(r'\b(' + '|'.join(map(re.escape, COMMON_KEYWORDS)) + r')\b', re.I)
+
+
+@lru_cache(maxsize=512)
+def _find_common_keywords(job_text: str) -> Tuple[str, ...]:
+    """COMMON_KEYWORDS found as whole words, in order of first appearance."""
+    return tuple(dict.fromkeys(m.lower() for m in _KW_RE.findall(job_text)))
+
 
 class JobAnalyzer:
     """Analyzes job postings using GPT-4o-mini to extract keywords and recommend CV version."""
 
     def __init__(self, config_manager: ConfigManager):
-        load_dotenv()
+        load_env()  # no-op if the application already loaded .env
         self.api_key = os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             logger.error("OPENAI_API_KEY not found in environment variables")
             raise ValueError("OPENAI_API_KEY not found in environment variables")
 
-        logger.debug(f"Initializing JobAnalyzer with API key: {self.api_key[:20]}...")
-        self.client = OpenAI(api_key=self.api_key, timeout=30.0)  # Add 30 second timeout
+        logger.debug("Initializing JobAnalyzer with API key: %.20s...", self.api_key)
+        self._http = DefaultHttpxClient(http2=True, limits=POOL_LIMITS)
+        self.client = OpenAI(api_key=self.api_key, timeout=30.0, http_client=self._http)  # Add 30 second timeout
         self.config = config_manager
         self.model = "gpt-4o-mini"
-        logger.info(f"JobAnalyzer initialized with model: {self.model}")
+        self._system_msg = {
+            "role": "system",
+            "content": "You are an expert ATS (Applicant Tracking System) analyzer and CV optimization specialist. Analyze job postings and extract key information for CV tailoring."
+        }
+        self._cache_templates()
+        logger.info("JobAnalyzer initialized with model: %s", self.model)
+
+    def close(self) -> None:
+        """Close the connection pool of the client."""
+        self.client.close()
+
+    def _make_async_client(self) -> AsyncOpenAI:
+        """
+        Create an async client for one round of async analysis.
+
+        Use it as an async context manager so its connection pool is closed
+        afterwards. The SDK retries 429/5xx with backoff and honours
+        retry-after.
+        """
+        return AsyncOpenAI(
+            api_key=self.api_key,
+            timeout=30.0,
+            max_retries=3,
+            http_client=DefaultAsyncHttpxClient(http2=True, limits=POOL_LIMITS)
+        )
+
+    def _cache_templates(self) -> None:
+        """Look up the prompt templates and fallback title once per config."""
+        self._prompt_template = self.config.get_job_analysis_prompt()
+        self._batch_prompt_template = self.config.get_batch_analysis_prompt()
+        self._fallback_title = self.config.get_fallback_title()
+        self._version_automaton = self._build_version_automaton()
+
+    def _build_version_automaton(self):
+        """Aho-Corasick automaton mapping each version keyword to the versions listing it."""
+        if ahocorasick is None:
+            return None
+        versions_by_keyword = {}
+        for version, keywords in self.config.cv_config.get("version_keywords", {}).items():
+            for keyword in keywords:
+                versions_by_keyword.setdefault(keyword.lower(), []).append(version)
+        if not versions_by_keyword:
+            # an automaton without words cannot be searched
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword, versions in versions_by_keyword.items():
+            automaton.add_word(keyword, (keyword, versions))
+        automaton.make_automaton()
+        return automaton
+
+    def reload_config(self) -> None:
+        """Reload the configuration files and refresh the cached templates."""
+        self.config = ConfigManager(str(self.config.config_dir))
+        self._cache_templates()
+        logger.info("Configuration reloaded")
 
     def test_connection(self) -> bool:
         """Test OpenAI API connection."""
@@ -43,7 +150,7 @@ class JobAnalyzer:
                 logger.warning("API connection test: FAILED (unexpected response)")
             return result
         except Exception as e:
-            logger.error(f"API connection test failed: {type(e).__name__}: {e}")
+            logger.error("API connection test failed: %s: %s", type(e).__name__, e)
             return False
 
     def analyze_job_posting(self, job_text: str) -> Dict[str, any]:
@@ -53,90 +160,365 @@ class JobAnalyzer:
         Returns:
             Dict with keys: role, version, confidence, keywords, ats_text, language
         """
-        logger.info("Starting job posting analysis...")
-        logger.debug(f"Job text length: {len(job_text)} characters")
+        return self.analyze_job_postings_batch([job_text])[0]
+
+    def analyze_job_postings_batch(self, job_texts: List[str]) -> List[Dict[str, any]]:
+        """
+        Analyze several job postings with one GPT-4o-mini request per
+        MAX_BATCH_SIZE postings.
 
+        Postings missing from the AI response, or all postings of a request
+        that fails, are analyzed with the keyword-based fallback instead.
+
+        Returns:
+            One result dict per posting, in input order (see analyze_job_posting)
+        """
+        if not job_texts:
+            return []
+
+        logger.info("Starting analysis of %d job posting(s)...", len(job_texts))
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, job_text in enumerate(job_texts, 1):
+                logger.debug("Job %d text length: %d characters", i, len(job_text))
+
+        results = [self._cache_get(job_text) for job_text in job_texts]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if len(pending) < len(job_texts):
+            logger.info("Using cached analysis for %d posting(s)", len(job_texts) - len(pending))
+        if not pending:
+            return results
+
+        # Keep each request's output budget well below the model's limit
+        for start in range(0, len(pending), MAX_BATCH_SIZE):
+            chunk = pending[start:start + MAX_BATCH_SIZE]
+            analyzed = self._analyze_chunk([job_texts[i] for i in chunk])
+            for i, result in zip(chunk, analyzed):
+                results[i] = result
+        return results
+
+    def _analyze_chunk(self, job_texts: List[str]) -> List[Dict[str, any]]:
+        """Analyze up to MAX_BATCH_SIZE uncached postings with one API request."""
         # Detect language first
-        detected_language = detect_language(job_text)
-        logger.info(f"Detected language: {detected_language}")
+        detected_languages = [detect_language(job_text) for job_text in job_texts]
+        logger.info("Detected language(s): %s", ', '.join(detected_languages))
 
-        prompt_template = self.config.get_job_analysis_prompt()
-        prompt = prompt_template.format(job_text=job_text)
-        logger.debug(f"Generated prompt length: {len(prompt)} characters")
+        prompt = self._build_prompt(job_texts)
+        logger.debug("Generated prompt length: %d characters", len(prompt))
 
         try:
             logger.info("Calling OpenAI API...")
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert ATS (Applicant Tracking System) analyzer and CV optimization specialist. Analyze job postings and extract key information for CV tailoring."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=500,
-                temperature=0.3,
-                timeout=30.0  # 30 second timeout
-            )
+            response = self.client.chat.completions.create(**self._completion_args(prompt, len(job_texts)))
             logger.info("Received response from OpenAI API")
+            return self._results_from_response(response, job_texts, detected_languages)
 
-            ai_response = response.choices[0].message.content
-            logger.debug(f"AI response: {ai_response[:200]}...")
+        except Exception as e:
+            logger.error("Error analyzing job posting with AI: %s: %s", type(e).__name__, e)
+            logger.info("Falling back to keyword-based analysis")
+            return [self._fallback_analysis(job_text) for job_text in job_texts]
 
-            result = parse_ai_response(ai_response)
-            logger.info(f"Parsed result - Company: {result['company']}, Role: {result['role']}, Version: {result['version']}, Confidence: {result['confidence']}")
+    async def analyze_job_posting_async(self, job_text: str) -> Dict[str, any]:
+        """Analyze one job posting without blocking the event loop (see analyze_job_posting)."""
+        async with self._make_async_client() as aclient:
+            return await self._analyze_async(aclient, job_text)
 
-            # Add detected language to result
-            result['language'] = detected_language
+    async def analyze_many(self, job_texts: List[str], concurrency: int = MAX_CONCURRENT_REQUESTS) -> List[Dict[str, any]]:
+        """
+        Analyze job postings concurrently, one request per posting.
 
-            # Validate and fallback
-            if not result['company']:
-                logger.warning("No company extracted, trying email/URL extraction")
-                result['company'] = extract_company_from_email(job_text)
-                if not result['company']:
-                    logger.warning("No company found, using 'Unknown_Company'")
-                    result['company'] = 'Unknown_Company'
+        At most `concurrency` requests are in flight at once to stay under the
+        API rate limits.
 
-            if not result['role']:
-                logger.warning("No role extracted, using fallback title")
-                result['role'] = self.config.get_fallback_title()
+        Returns:
+            One result dict per posting, in input order (see analyze_job_posting)
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
 
-            if not validate_version(result['version']):
-                logger.warning(f"Invalid version '{result['version']}', using fallback selection")
-                result['version'] = self._fallback_version_selection(job_text)
+        logger.info("Starting concurrent analysis of %d job posting(s)...", len(job_texts))
+        async with self._make_async_client() as aclient:
+            async def analyze(job_text: str) -> Dict[str, any]:
+                async with semaphore:
+                    return await self._analyze_async(aclient, job_text)
 
-            if result['confidence'] == 0.0:
-                logger.warning("Zero confidence, setting to 0.5")
-                result['confidence'] = 0.5
+            results = await asyncio.gather(*(analyze(job_text) for job_text in job_texts), return_exceptions=True)
 
-            logger.info(f"Analysis complete - Final: Company={result['company']}, Role={result['role']}, Version={result['version']}, Language={detected_language}")
-            return result
+        return [
+            self._fallback_analysis(job_text) if isinstance(result, Exception) else result
+            for job_text, result in zip(job_texts, results)
+        ]
+
+    async def _analyze_async(self, aclient: AsyncOpenAI, job_text: str) -> Dict[str, any]:
+        """Analyze one job posting with the given async client."""
+        cached = self._cache_get(job_text)
+        if cached is not None:
+            logger.info("Using cached analysis")
+            return cached
+
+        detected_language = detect_language(job_text)
+        prompt = self._build_prompt([job_text])
 
+        try:
+            response = await aclient.chat.completions.create(**self._completion_args(prompt, 1))
+            return self._results_from_response(response, [job_text], [detected_language])[0]
         except Exception as e:
-            logger.error(f"Error analyzing job posting with AI: {type(e).__name__}: {e}")
+            logger.error("Error analyzing job posting with AI: %s: %s", type(e).__name__, e)
             logger.info("Falling back to keyword-based analysis")
             return self._fallback_analysis(job_text)
 
-    def _fallback_version_selection(self, job_text: str) -> str:
+    def submit_batch(self, job_texts: List[str]) -> str:
+        """
+        Submit job postings to the OpenAI Batch API for offline analysis.
+
+        Batch requests cost half as much as regular ones and are completed
+        within 24 hours; collect the results with poll_batch.
+
+        Returns:
+            The batch ID
+
+        Raises:
+            ValueError: If job_texts is empty
+        """
+        if not job_texts:
+            raise ValueError("No job postings to submit")
+
+        lines = []
+        for i, job_text in enumerate(job_texts):
+            body = self._completion_args(self._build_prompt([job_text]), 1)
+            del body["timeout"]
+            lines.append(json.dumps({
+                "custom_id": f"job-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }, ensure_ascii=False))
+
+        logger.info("Submitting batch of %d job posting(s)...", len(job_texts))
+        batch_file = self.client.files.create(
+            file=("job_postings.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info("Submitted batch %s", batch.id)
+        return batch.id
+
+    def poll_batch(self, batch_id: str, job_texts: List[str], interval: float = BATCH_POLL_INTERVAL) -> List[Dict[str, any]]:
+        """
+        Wait for a batch from submit_batch to finish and collect its results.
+
+        job_texts must be the postings the batch was submitted with. Postings
+        the batch failed to analyze fall back to keyword-based analysis.
+
+        Returns:
+            One result dict per posting, in input order (see analyze_job_posting)
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in BATCH_FINAL_STATUSES:
+            logger.debug("Batch %s status: %s", batch_id, batch.status)
+            time.sleep(interval)
+            batch = self.client.batches.retrieve(batch_id)
+        logger.info("Batch %s finished with status: %s", batch_id, batch.status)
+
+        responses = {}
+        if batch.status == "completed" and batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                response = item.get("response") or {}
+                if response.get("status_code") == 200:
+                    choice = response["body"]["choices"][0]
+                    responses[item["custom_id"]] = (choice["message"]["content"], choice.get("finish_reason"))
+
+        results = []
+        for i, job_text in enumerate(job_texts):
+            if f"job-{i}" not in responses:
+                logger.warning("Posting %d missing from batch output, using fallback analysis", i + 1)
+                results.append(self._fallback_analysis(job_text))
+                continue
+            ai_response, finish_reason = responses[f"job-{i}"]
+            if finish_reason == "length":
+                logger.warning("Posting %d was cut off at the token limit, using fallback analysis", i + 1)
+                results.append(self._fallback_analysis(job_text))
+                continue
+            result = parse_ai_response(ai_response)
+            if result is None:
+                logger.warning("Could not parse batch output for posting %d, using fallback analysis", i + 1)
+                results.append(self._fallback_analysis(job_text))
+                continue
+            cacheable = self._is_cacheable(result, finish_reason)
+            result = self._validate_result(result, job_text, detect_language(job_text))
+            if cacheable:
+                self._cache_set(job_text, result)
+            results.append(result)
+        return results
+
+    def _completion_args(self, prompt: str, job_count: int) -> Dict[str, any]:
+        """Chat completion arguments for an analysis prompt covering job_count postings."""
+        return {
+            "model": self.model,
+            "messages": [
+                self._system_msg,
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": MAX_TOKENS_PER_POSTING * job_count,
+            "temperature": 0.3,
+            "response_format": {"type": "json_object"},
+            "timeout": 30.0  # 30 second timeout
+        }
+
+    def _results_from_response(self, response, job_texts: List[str], detected_languages: List[str]) -> List[Dict[str, any]]:
+        """Parse and validate one result per posting from a chat completion."""
+        ai_response = response.choices[0].message.content
+        finish_reason = response.choices[0].finish_reason
+        logger.debug("AI response: %.200s...", ai_response)
+
+        if finish_reason == "length":
+            logger.warning("AI response was cut off at the token limit, using fallback analysis")
+            return [self._fallback_analysis(job_text) for job_text in job_texts]
+
+        parsed_results = parse_ai_batch_response(ai_response, len(job_texts))
+
+        results = []
+        for job_text, detected_language, result in zip(job_texts, detected_languages, parsed_results):
+            if result is None:
+                logger.warning("Posting missing from AI response or unparseable, using fallback analysis")
+                results.append(self._fallback_analysis(job_text))
+            else:
+                cacheable = self._is_cacheable(result, finish_reason)
+                result = self._validate_result(result, job_text, detected_language)
+                if cacheable:
+                    self._cache_set(job_text, result)
+                results.append(result)
+        return results
+
+    @staticmethod
+    def _is_cacheable(result: Dict[str, any], finish_reason: Optional[str]) -> bool:
+        """
+        Whether a parsed AI result is complete enough to cache.
+
+        Must be checked before _validate_result, which papers over missing
+        fields; a truncated or partial answer is re-requested next time.
+        """
+        return (
+            finish_reason == "stop"
+            and bool(result['ats_text'])
+            and bool(result['keywords'])
+            and validate_version(result['version'])
+        )
+
+    def _cache_path(self, job_text: str) -> Path:
+        """Cache file for a posting, keyed on the model and its single-posting prompt."""
+        prompt = self._build_prompt([job_text.strip()])
+        key = hashlib.sha256(f"{self.model}|{prompt}".encode("utf-8")).hexdigest()
+        return CACHE_DIR / f"{key}.json"
+
+    def _cache_get(self, job_text: str) -> Optional[Dict[str, any]]:
+        """Return the cached analysis of a posting, or None if missing or expired."""
+        path = self._cache_path(job_text)
+        try:
+            if time.time() - path.stat().st_mtime > CACHE_TTL:
+                return None
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _cache_set(self, job_text: str, result: Dict[str, any]) -> None:
+        """Store the analysis of a posting; a cache that cannot be written is skipped."""
+        path = self._cache_path(job_text)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Could not write analysis cache: %s", e)
+
+    def clear_cache(self) -> int:
+        """Delete all cached analyses and return how many were removed."""
+        removed = 0
+        for path in CACHE_DIR.glob("*.json"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        logger.info("Cleared %d cached analyses", removed)
+        return removed
+
+    def _build_prompt(self, job_texts: List[str]) -> str:
+        """Build the analysis prompt for one posting, or the batch prompt for several."""
+        if len(job_texts) == 1:
+            return self._prompt_template.format(job_text=job_texts[0])
+
+        job_blocks = "\n\n".join(
+            f"=== JOB {i} ===\n{job_text.strip()}" for i, job_text in enumerate(job_texts, 1)
+        )
+        return self._batch_prompt_template.format(
+            job_count=len(job_texts),
+            job_texts=job_blocks
+        )
+
+    def _validate_result(self, result: Dict[str, any], job_text: str, detected_language: str) -> Dict[str, any]:
+        """Fill in missing or invalid fields of a parsed AI result."""
+        logger.info("Parsed result - Company: %s, Role: %s, Version: %s, Confidence: %s", result['company'], result['role'], result['version'], result['confidence'])
+
+        # Add detected language to result
+        result['language'] = detected_language
+
+        # Validate and fallback; the lowercased text is only needed, and then
+        # computed once, if a fallback runs
+        job_text_lower = None
+        if not result['company']:
+            logger.warning("No company extracted, trying email/URL extraction")
+            job_text_lower = job_text.lower()
+            result['company'] = extract_company_from_email(job_text, job_text_lower)
+            if not result['company']:
+                logger.warning("No company found, using 'Unknown_Company'")
+                result['company'] = 'Unknown_Company'
+
+        if not result['role']:
+            logger.warning("No role extracted, using fallback title")
+            result['role'] = self._fallback_title
+
+        if not validate_version(result['version']):
+            logger.warning("Invalid version '%s', using fallback selection", result['version'])
+            result['version'] = self._fallback_version_selection(job_text, job_text_lower)
+
+        if result['confidence'] == 0.0:
+            logger.warning("Zero confidence, setting to 0.5")
+            result['confidence'] = 0.5
+
+        logger.info("Analysis complete - Final: Company=%s, Role=%s, Version=%s, Language=%s", result['company'], result['role'], result['version'], detected_language)
+        return result
+
+    def _fallback_version_selection(self, job_text: str, job_text_lower: Optional[str] = None) -> str:
         """Fallback keyword-based version selection if AI fails."""
         logger.debug("Running fallback version selection...")
-        job_text_lower = job_text.lower()
-        version_scores = {}
+        if job_text_lower is None:
+            job_text_lower = job_text.lower()
+        version_keywords = self.config.cv_config.get("version_keywords", {})
 
         # Score each version based on keyword matches
-        for version, keywords in self.config.cv_config.get("version_keywords", {}).items():
-            score = sum(1 for keyword in keywords if keyword.lower() in job_text_lower)
-            version_scores[version] = score
-            logger.debug(f"Version {version}: {score} keyword matches")
+        if self._version_automaton is not None:
+            version_scores = dict.fromkeys(version_keywords, 0)
+            found = {keyword for _, (keyword, _) in self._version_automaton.iter(job_text_lower)}
+            for keyword in found:
+                for version in self._version_automaton.get(keyword)[1]:
+                    version_scores[version] += 1
+        else:
+            version_scores = {
+                version: sum(1 for keyword in keywords if keyword.lower() in job_text_lower)
+                for version, keywords in version_keywords.items()
+            }
+        for version, score in version_scores.items():
+            logger.debug("Version %s: %d keyword matches", version, score)
 
         # Return version with highest score, default to FAANG
         if version_scores:
             best_version = max(version_scores, key=version_scores.get)
-            logger.info(f"Fallback selected version: {best_version} (score: {version_scores[best_version]})")
+            logger.info("Fallback selected version: %s (score: %d)", best_version, version_scores[best_version])
             return best_version
 
         logger.warning("No version scores, defaulting to FAANG")
@@ -145,25 +527,27 @@ class JobAnalyzer:
     def _fallback_analysis(self, job_text: str) -> Dict[str, any]:
         """Fallback analysis if API fails."""
         logger.info("Running fallback analysis (no API)")
-        version = self._fallback_version_selection(job_text)
+        job_text_lower = job_text.lower()
+        version = self._fallback_version_selection(job_text, job_text_lower)
 
         # Detect language
         detected_language = detect_language(job_text)
-        logger.info(f"Detected language (fallback): {detected_language}")
+        logger.info("Detected language (fallback): %s", detected_language)
 
         # Try to extract company name
-        company = extract_company_from_email(job_text)
+        company = extract_company_from_email(job_text, job_text_lower)
         if not company:
             logger.warning("No company found in fallback, using 'Unknown_Company'")
             company = 'Unknown_Company'
 
         # Extract basic keywords
         keywords = self._extract_basic_keywords(job_text)
-        logger.debug(f"Extracted {len(keywords)} keywords: {', '.join(keywords[:10])}...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Extracted %d keywords: %s...", len(keywords), ', '.join(keywords[:10]))
 
         result = {
             'company': company,
-            'role': self.config.get_fallback_title(),
+            'role': self._fallback_title,
             'version': version,
             'confidence': 0.5,
             'keywords': keywords[:20],
@@ -171,22 +555,12 @@ class JobAnalyzer:
             'language': detected_language
         }
 
-        logger.info(f"Fallback analysis complete - Company: {result['company']}, Role: {result['role']}, Version: {result['version']}, Language: {detected_language}")
+        logger.info("Fallback analysis complete - Company: %s, Role: %s, Version: %s, Language: %s", result['company'], result['role'], result['version'], detected_language)
         return result
 
     def _extract_basic_keywords(self, job_text: str) -> List[str]:
         """Extract basic keywords using simple text processing."""
-        # Common technical keywords
-        common_keywords = [
-            'python', 'javascript', 'java', 'aws', 'docker', 'kubernetes',
-            'sql', 'api', 'react', 'node', 'machine learning', 'data',
-            'cloud', 'microservices', 'agile', 'ci/cd', 'git', 'rest',
-            'backend', 'frontend', 'full-stack', 'database', 'linux'
-        ]
-
-        job_text_lower = job_text.lower()
-        found_keywords = [kw for kw in common_keywords if kw in job_text_lower]
-        return found_keywords
+        return list(_find_common_keywords(job_text))
 
     def _generate_basic_ats_text(self, keywords: List[str], version: str) -> str:
         """Generate basic ATS text from keywords."""
@@ -1,8 +1,13 @@
 """Logging configuration for CV automation system."""
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from datetime import datetime
+
+# Background thread that formats and writes queued records; see setup_logger
+_listener = None
 
 
 def setup_logger(name: str = "cv_automation", level: str = "INFO") -> logging.Logger:
@@ -38,10 +43,11 @@ def setup_logger(name: str = "cv_automation", level: str = "INFO") -> logging.Lo
     )
     console_handler.setFormatter(console_formatter)
 
-    # File handler with detailed formatting
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_handler = logging.FileHandler(
-        log_dir / f"cv_automation_{timestamp}.log",
+    # File handler with detailed formatting; one file per day, two weeks kept
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        log_dir / "cv_automation.log",
+        when="midnight",
+        backupCount=14,
         encoding='utf-8'
     )
     file_handler.setLevel(logging.DEBUG)  # Always log DEBUG to file
@@ -50,13 +56,28 @@ def setup_logger(name: str = "cv_automation", level: str = "INFO") -> logging.Lo
     )
     file_handler.setFormatter(file_formatter)
 
-    # Add handlers
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    # Log calls only enqueue records; a listener thread does the formatting
+    # and the console/file I/O
+    global _listener
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(shutdown_logger)
 
     return logger
 
 
+def shutdown_logger() -> None:
+    """Flush queued log records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def get_logger(name: str = "cv_automation") -> logging.Logger:
     """Get existing logger or create new one."""
     return logging.getLogger(name)
\ No newline at end of file
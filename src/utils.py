@@ -1,14 +1,68 @@
 """Utility functions for CV automation system."""
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import re
+from dotenv import load_dotenv
+
+try:
+    # orjson parses JSON-mode responses several times faster than json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# "LABEL: value" lines of an AI analysis response
+_RESP_RE = re.compile(r'^[ \t]*(COMPANY|ROLE|VERSION|CONFIDENCE|KEYWORDS|ATS_TEXT):(.*)$', re.M)
+_RESP_FIELDS = {'COMPANY': 'company', 'ROLE': 'role', 'VERSION': 'version'}
+
+# Common Spanish words that are distinctive
+_SPANISH_INDICATORS = frozenset([
+    'años', 'experiencia', 'trabajo', 'empresa', 'equipo', 'desarrollador',
+    'ingeniero', 'conocimientos', 'habilidades', 'requisitos', 'buscamos',
+    'para', 'con', 'del', 'las', 'los', 'una', 'y', 'en', 'de', 'la', 'el',
+    'será', 'tendrá', 'debe', 'nuestro', 'nuestra', 'sobre', 'entre',
+    'responsabilidades', 'ofrecemos', 'tecnologías', 'proyectos'
+])
+
+# Common English words that are distinctive
+_ENGLISH_INDICATORS = frozenset([
+    'experience', 'work', 'team', 'developer', 'engineer', 'skills',
+    'requirements', 'looking', 'for', 'with', 'the', 'and', 'in', 'of',
+    'will', 'should', 'our', 'about', 'between', 'responsibilities',
+    'offering', 'technologies', 'projects', 'years', 'company'
+])
+
+# Word tokens of a text, for matching against the indicator sets
+_WORD_RE = re.compile(r'\w+')
+
+# Email domains and website names used to guess the company
+_EMAIL_RE = re.compile(r'[\w.-]+@([\w.-]+\.\w+)')
+_URL_RE = re.compile(r'https?://(?:www\.)?([\w-]+)\.')
+
+# Characters dropped from filenames, and separator runs turned into '_'
+_SANITIZE_RE1 = re.compile(r'[^\w\s-]')
+_SANITIZE_RE2 = re.compile(r'[-\s]+')
+
+# Header the model puts before each posting's block in a batched response
+_JOB_HEADER_RE = re.compile(r'\s*===\s*JOB\s+(\d+)\s*===')
+
+
+_dotenv_loaded = False
+
+
+def load_env() -> None:
+    """Load variables from .env into the environment, once per process."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
 
 
 def sanitize_filename(text: str) -> str:
     """Convert text to valid filename."""
     # Remove special characters, replace spaces with underscores
-    sanitized = re.sub(r'[^\w\s-]', '', text.lower())
-    sanitized = re.sub(r'[-\s]+', '_', sanitized)
+    sanitized = _SANITIZE_RE1.sub('', text.lower())
+    sanitized = _SANITIZE_RE2.sub('_', sanitized)
     return sanitized.strip('_')
 
 
@@ -24,13 +78,16 @@ def validate_job_posting(file_path: str) -> bool:
 
 def read_file(file_path: str) -> str:
     """Read file contents with error handling."""
+    # Read the bytes once and decode them, instead of re-reading on fallback
+    with open(file_path, 'rb') as f:
+        data = f.read()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        text = data.decode('utf-8')
     except UnicodeDecodeError:
         # Try with different encoding
-        with open(file_path, 'r', encoding='latin-1') as f:
-            return f.read()
+        text = data.decode('latin-1')
+    # Normalize line endings like text mode did
+    return text.replace('\r\n', '\n').replace('\r', '\n')
 
 
 def ensure_directory(dir_path: str) -> Path:
@@ -40,8 +97,59 @@ def ensure_directory(dir_path: str) -> Path:
     return path
 
 
-def parse_ai_response(response: str) -> dict:
-    """Parse AI response into structured data."""
+def _load_json(text: str):
+    """Decode a JSON document, or return None if text is not valid JSON."""
+    try:
+        return _json_loads(text)
+    except ValueError:
+        return None
+
+
+def _result_from_json(data: dict) -> dict:
+    """Normalize a JSON analysis object to the parse_ai_response result shape."""
+    keywords = data.get('keywords') or []
+    if isinstance(keywords, str):
+        keywords = keywords.split(',')
+    elif not isinstance(keywords, list):
+        keywords = []
+
+    try:
+        confidence = float(data.get('confidence') or 0.0)
+    except (TypeError, ValueError):
+        confidence = 0.5
+
+    return {
+        'company': str(data.get('company') or '').strip(),
+        'role': str(data.get('role') or '').strip(),
+        'version': str(data.get('version') or '').strip(),
+        'confidence': confidence,
+        'keywords': [str(k).strip() for k in keywords if str(k).strip()],
+        'ats_text': str(data.get('ats_text') or '').strip()
+    }
+
+
+def parse_ai_response(response: str) -> Optional[dict]:
+    """
+    Parse AI response into structured data.
+
+    JSON-mode responses are read as a JSON object; anything else, such as
+    malformed JSON, is parsed as 'LABEL: value' lines.
+
+    Returns:
+        The parsed result, or None if the response is neither a JSON object
+        nor contains any label (e.g. a truncated JSON reply)
+    """
+    if not response:
+        return None
+
+    data = _load_json(response)
+    if isinstance(data, dict):
+        return _result_from_json(data)
+
+    matches = list(_RESP_RE.finditer(response))
+    if not matches:
+        return None
+
     result = {
         'company': '',
         'role': '',
@@ -51,35 +159,73 @@ def parse_ai_response(response: str) -> dict:
         'ats_text': ''
     }
 
-    lines = response.strip().split('\n')
-    current_section = None
-
-    for line in lines:
-        line = line.strip()
+    for i, match in enumerate(matches):
+        label, value = match.group(1), match.group(2).strip()
 
-        if line.startswith('COMPANY:'):
-            result['company'] = line.replace('COMPANY:', '').strip()
-        elif line.startswith('ROLE:'):
-            result['role'] = line.replace('ROLE:', '').strip()
-        elif line.startswith('VERSION:'):
-            result['version'] = line.replace('VERSION:', '').strip()
-        elif line.startswith('CONFIDENCE:'):
+        if label in _RESP_FIELDS:
+            result[_RESP_FIELDS[label]] = value
+        elif label == 'CONFIDENCE':
             try:
-                result['confidence'] = float(line.replace('CONFIDENCE:', '').strip())
+                result['confidence'] = float(value)
             except ValueError:
                 result['confidence'] = 0.5
-        elif line.startswith('KEYWORDS:'):
-            keywords_str = line.replace('KEYWORDS:', '').strip()
-            result['keywords'] = [k.strip() for k in keywords_str.split(',')]
-        elif line.startswith('ATS_TEXT:'):
-            current_section = 'ats_text'
-            result['ats_text'] = line.replace('ATS_TEXT:', '').strip()
-        elif current_section == 'ats_text' and line:
-            result['ats_text'] += ' ' + line
+        elif label == 'KEYWORDS':
+            result['keywords'] = [k.strip() for k in value.split(',')]
+        else:
+            # ATS text runs until the next label and may span several lines
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(response)
+            ats_lines = response[match.start(2):end].split('\n')
+            result['ats_text'] = ' '.join(line.strip() for line in ats_lines if line.strip())
 
     return result
 
 
+def parse_ai_batch_response(response: str, count: int) -> List[Optional[dict]]:
+    """
+    Parse a batched AI response into one structured result per job.
+
+    A JSON response holds the results, in order, in its "jobs" list, or is
+    itself the single result. Otherwise the response is read as text
+    blocks separated by '---END---' that may start with an '=== JOB n ==='
+    header; blocks without a header are taken in order. A response without
+    any separator is treated as a single block.
+
+    Args:
+        response: Raw AI response text
+        count: Number of jobs that were sent
+
+    Returns:
+        List of `count` parsed results; jobs missing from the response, or
+        whose block could not be parsed, are None
+    """
+    if not response:
+        return [None] * count
+
+    data = _load_json(response)
+    if isinstance(data, dict):
+        jobs = data['jobs'] if isinstance(data.get('jobs'), list) else [data]
+        results = [_result_from_json(job) if isinstance(job, dict) else None for job in jobs[:count]]
+        return results + [None] * (count - len(results))
+
+    results = [None] * count
+    position = 0
+
+    for block in response.split('---END---'):
+        if not block.strip():
+            continue
+
+        header = _JOB_HEADER_RE.match(block)
+        if header:
+            position = int(header.group(1)) - 1
+            block = block[header.end():]
+
+        if 0 <= position < count and results[position] is None:
+            results[position] = parse_ai_response(block)
+        position += 1
+
+    return results
+
+
 def format_confidence(confidence: float) -> str:
     """Format confidence as percentage."""
     return f"{int(confidence * 100)}%"
@@ -91,25 +237,26 @@ def validate_version(version: str) -> bool:
     return version in valid_versions
 
 
-def extract_company_from_email(text: str) -> str:
+def extract_company_from_email(text: str, text_lower: Optional[str] = None) -> str:
     """
     Extract company name from email domain or URL in text.
 
     Args:
         text: Text to search for email/URL
+        text_lower: text.lower(), if the caller already has it
 
     Returns:
         Extracted company name or empty string
     """
-    import re
+    if text_lower is None:
+        text_lower = text.lower()
 
     # Look for email addresses
-    email_pattern = r'[\w\.-]+@([\w\.-]+\.\w+)'
-    emails = re.findall(email_pattern, text.lower())
+    email = _EMAIL_RE.search(text_lower)
 
-    if emails:
+    if email:
         # Get domain from first email
-        domain = emails[0]
+        domain = email.group(1)
         # Remove common TLDs and get company name
         company = domain.split('.')[0]
         # Skip generic domains
@@ -117,49 +264,34 @@ def extract_company_from_email(text: str) -> str:
             return company.capitalize()
 
     # Look for website URLs
-    url_pattern = r'https?://(?:www\.)?([\w-]+)\.'
-    urls = re.findall(url_pattern, text.lower())
+    url = _URL_RE.search(text_lower)
 
-    if urls:
-        company = urls[0]
+    if url:
+        company = url.group(1)
         if company not in ['gmail', 'yahoo', 'hotmail', 'outlook']:
             return company.capitalize()
 
     return ''
 
 
+@lru_cache(maxsize=512)
 def detect_language(text: str) -> str:
     """
     Detect if text is in Spanish or English based on common words.
 
+    Results are memoized, so the analysis and fallback paths share one
+    scan of each posting.
+
     Args:
         text: The text to analyze
 
     Returns:
         'es' for Spanish, 'en' for English
     """
-    text_lower = text.lower()
-
-    # Common Spanish words that are distinctive
-    spanish_indicators = [
-        'años', 'experiencia', 'trabajo', 'empresa', 'equipo', 'desarrollador',
-        'ingeniero', 'conocimientos', 'habilidades', 'requisitos', 'buscamos',
-        'para', 'con', 'del', 'las', 'los', 'una', 'y', 'en', 'de', 'la', 'el',
-        'será', 'tendrá', 'debe', 'nuestro', 'nuestra', 'sobre', 'entre',
-        'responsabilidades', 'ofrecemos', 'tecnologías', 'proyectos'
-    ]
-
-    # Common English words that are distinctive
-    english_indicators = [
-        'experience', 'work', 'team', 'developer', 'engineer', 'skills',
-        'requirements', 'looking', 'for', 'with', 'the', 'and', 'in', 'of',
-        'will', 'should', 'our', 'about', 'between', 'responsibilities',
-        'offering', 'technologies', 'projects', 'years', 'company'
-    ]
-
-    # Count matches for each language
-    spanish_count = sum(1 for word in spanish_indicators if f' {word} ' in f' {text_lower} ')
-    english_count = sum(1 for word in english_indicators if f' {word} ' in f' {text_lower} ')
+    # Count distinct indicator words found for each language
+    words = set(_WORD_RE.findall(text.lower()))
+    spanish_count = len(words & _SPANISH_INDICATORS)
+    english_count = len(words & _ENGLISH_INDICATORS)
 
     # Determine language based on higher count
     if spanish_count > english_count:
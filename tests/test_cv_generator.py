@@ -0,0 +1,108 @@
+"""Tests for LaTeX file updates in CVGenerator."""
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import sys
+
+# Add parent directory to path
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.config_manager import ConfigManager
+from src import cv_generator
+from src.cv_generator import CVGenerator
+
+
+class TestCVGenerator(unittest.TestCase):
+    """Test CV generation against a scratch copy of the LaTeX sources."""
+
+    def setUp(self):
+        """Copy the LaTeX sources and config into a temporary working directory."""
+        self.old_cwd = os.getcwd()
+        self.workdir = tempfile.mkdtemp()
+        for name in ['sections', 'setup', 'config']:
+            shutil.copytree(ROOT / name, Path(self.workdir) / name)
+        shutil.copy(ROOT / 'main.tex', self.workdir)
+        os.chdir(self.workdir)
+
+        self.generator = CVGenerator(ConfigManager())
+        self.analysis = {
+            'role': 'Data Engineer',
+            'version': 'Climate',
+            'keywords': ['python', 'sql'],
+            'ats_text': 'Data engineer with 2 years of experience.',
+            'language': 'en'
+        }
+
+    def tearDown(self):
+        """Remove the temporary working directory."""
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def test_generate_cv_updates_all_files(self):
+        """Test that title, ATS text and version flag are all written."""
+        self.assertTrue(self.generator.generate_cv(self.analysis))
+
+        self.assertIn('{\\large\\bfseries Data Engineer}\\par', Path('sections/header.tex').read_text(encoding='utf-8'))
+        self.assertIn('\\newcommand{\\jobtitle}{Data Engineer}', Path('setup/macros.tex').read_text(encoding='utf-8'))
+        self.assertIn('\\atsboost{Data engineer with 2 years of experience.}', Path('sections/sidebar.tex').read_text(encoding='utf-8'))
+
+        main = Path('main.tex').read_text(encoding='utf-8')
+        self.assertIn('\\newif\\ifES\n\\Climatetrue\n\\input{setup/preamble.tex}', main)
+        self.assertNotIn('\\Gamingtrue', main)
+
+    def test_language_flag_is_replaced(self):
+        """Test that switching language back to English removes the ES flag."""
+        self.analysis['language'] = 'es'
+        self.assertTrue(self.generator.generate_cv(self.analysis))
+        self.assertIn('\\Climatetrue\n\\EStrue\n', Path('main.tex').read_text(encoding='utf-8'))
+
+        self.assertTrue(self.generator.update_version_flags('FAANG', 'en'))
+        main = Path('main.tex').read_text(encoding='utf-8')
+        self.assertIn('\\newif\\ifES\n\\FAANGtrue\n\\input{setup/preamble.tex}', main)
+        self.assertNotIn('\\EStrue', main)
+
+    def test_version_flags_with_crlf_line_endings(self):
+        """Test that an activation line with Windows line endings is replaced."""
+        main = Path('main.tex').read_bytes().replace(b'\n', b'\r\n')
+        Path('main.tex').write_bytes(main)
+
+        self.assertTrue(self.generator.update_version_flags('Startup'))
+        main = Path('main.tex').read_bytes()
+        self.assertIn(b'\\Startuptrue', main)
+        self.assertNotIn(b'\\Gamingtrue', main)
+
+    def test_missing_pattern_fails(self):
+        """Test that a missing \\atsboost command is reported as a failure."""
+        Path('sections/sidebar.tex').write_text('no boost here\n', encoding='utf-8')
+        self.assertFalse(self.generator.update_ats_boost('text'))
+
+    def test_locked_output_pdf_is_kept_as_main_pdf(self):
+        """Test that a PDF that cannot be moved to output/ survives cleanup as main.pdf."""
+        def fake_pdflatex(*args, **kwargs):
+            (cv_generator.BUILD_DIR / 'main.pdf').write_bytes(b'%PDF-1.5')
+            return mock.Mock(returncode=0, stderr='')
+
+        real_replace = os.replace
+
+        def locked_replace(src, dst):
+            if Path(dst).parent == Path('output'):
+                raise PermissionError('locked')
+            return real_replace(src, dst)
+
+        with mock.patch.object(cv_generator, '_which', lambda tool: tool if tool == 'pdflatex' else None), \
+                mock.patch.object(cv_generator.subprocess, 'run', side_effect=fake_pdflatex), \
+                mock.patch.object(cv_generator.os, 'replace', side_effect=locked_replace), \
+                mock.patch.object(cv_generator.time, 'sleep'):
+            self.assertTrue(self.generator.compile_pdf('cv'))
+
+        self.generator.cleanup_latex_artifacts()
+        self.assertTrue(Path('main.pdf').exists())
+        self.assertFalse(Path('output/cv.pdf').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,217 @@
+"""Tests for JobAnalyzer with a stubbed OpenAI client."""
+import asyncio
+import json
+import os
+import re
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+import sys
+
+import yaml
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import job_analyzer
+from src.config_manager import ConfigManager
+from src.job_analyzer import JobAnalyzer
+
+
+def make_result(company):
+    """A complete analysis object as the model returns it in JSON mode."""
+    return {
+        'company': company,
+        'role': 'Data Engineer',
+        'version': 'Climate',
+        'confidence': 0.8,
+        'keywords': ['python', 'sql'],
+        'ats_text': 'Data engineer with experience in Python and SQL.'
+    }
+
+
+class StubCompletions:
+    """Stand-in for client.chat.completions that answers every posting in the prompt."""
+
+    def __init__(self):
+        self.calls = []
+        self.content = None
+        self.finish_reason = 'stop'
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        content = self.content
+        if content is None:
+            prompt = kwargs['messages'][-1]['content']
+            count = len(re.findall(r'=== JOB \d+ ===', prompt)) or 1
+            content = json.dumps({'jobs': [make_result(f'Company{i}') for i in range(count)]})
+        choice = SimpleNamespace(message=SimpleNamespace(content=content), finish_reason=self.finish_reason)
+        return SimpleNamespace(choices=[choice])
+
+
+class StubAsyncClient:
+    """Stand-in for AsyncOpenAI that records whether it was closed."""
+
+    def __init__(self, completions):
+        self.completions = completions
+        self.chat = SimpleNamespace(completions=self)
+        self.closed = False
+
+    async def create(self, **kwargs):
+        return self.completions.create(**kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+
+def batch_line(index, content, finish_reason='stop', status_code=200):
+    """One line of a Batch API output file."""
+    body = {'choices': [{'message': {'content': content}, 'finish_reason': finish_reason}]}
+    return json.dumps({'custom_id': f'job-{index}', 'response': {'status_code': status_code, 'body': body}})
+
+
+class TestJobAnalyzer(unittest.TestCase):
+    """Test request batching and response caching of JobAnalyzer against a stubbed API."""
+
+    def setUp(self):
+        """Create an analyzer with a stubbed client and a temporary cache."""
+        self.cache_dir = tempfile.mkdtemp()
+        patches = [
+            mock.patch.dict(os.environ, {'OPENAI_API_KEY': 'sk-test-0000000000000000000000'}),
+            mock.patch.object(job_analyzer, 'CACHE_DIR', Path(self.cache_dir))
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.analyzer = JobAnalyzer(ConfigManager(str(Path(__file__).parent.parent / 'config')))
+        self.addCleanup(self.analyzer.client.close)
+        self.completions = StubCompletions()
+        self.analyzer.client = SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+
+    def tearDown(self):
+        """Remove the temporary cache."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_cache_hit_skips_api_call(self):
+        """Test that a posting analyzed before is served from the cache."""
+        first = self.analyzer.analyze_job_posting('Data engineer for a climate startup')
+        second = self.analyzer.analyze_job_posting('Data engineer for a climate startup')
+
+        self.assertEqual(len(self.completions.calls), 1)
+        self.assertEqual(first, second)
+
+    def test_cache_miss_calls_api(self):
+        """Test that a different posting is not answered from the cache."""
+        self.analyzer.analyze_job_posting('Data engineer for a climate startup')
+        self.analyzer.analyze_job_posting('Game developer for a studio')
+
+        self.assertEqual(len(self.completions.calls), 2)
+
+    def test_truncated_response_is_not_cached(self):
+        """Test that a cut-off reply is not cached, so the next call asks the API again."""
+        self.completions.content = json.dumps(make_result('Acme'))[:60]
+        self.completions.finish_reason = 'length'
+        self.analyzer.analyze_job_posting('Data engineer for a climate startup')
+
+        self.completions.content = None
+        self.completions.finish_reason = 'stop'
+        result = self.analyzer.analyze_job_posting('Data engineer for a climate startup')
+
+        self.assertEqual(len(self.completions.calls), 2)
+        self.assertEqual(result['company'], 'Company0')
+
+    def test_truncated_response_uses_fallback(self):
+        """Test that a reply cut off at the token limit is replaced by the fallback analysis."""
+        self.completions.content = json.dumps(make_result('Acme'))
+        self.completions.finish_reason = 'length'
+
+        result = self.analyzer.analyze_job_posting('Python data engineer, jobs@globex.com')
+
+        self.assertEqual(result['company'], 'Globex')
+        self.assertIn('python', result['keywords'])
+
+    def test_unparseable_response_uses_fallback(self):
+        """Test that a reply that is not valid JSON never yields an empty ATS text."""
+        self.completions.content = 'Sorry, I cannot help with that.'
+
+        result = self.analyzer.analyze_job_posting('Python data engineer, jobs@globex.com')
+
+        self.assertEqual(result['company'], 'Globex')
+        self.assertTrue(result['ats_text'])
+
+    def test_analyze_many_closes_async_client(self):
+        """Test that analyze_many returns results in order and closes its async client."""
+        aclient = StubAsyncClient(self.completions)
+        self.analyzer._make_async_client = lambda: aclient
+
+        results = asyncio.run(self.analyzer.analyze_many(['Posting one', 'Posting two'], concurrency=1))
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(len(self.completions.calls), 2)
+        self.assertTrue(aclient.closed)
+
+    def test_poll_batch_maps_and_validates_output_lines(self):
+        """Test that batch output is matched by custom_id and bad lines fall back uncached."""
+        output = '\n'.join([
+            batch_line(3, json.dumps(make_result('Delta'))),
+            batch_line(0, json.dumps(make_result('Alpha'))),
+            batch_line(1, json.dumps(make_result('Beta')), status_code=500),
+            batch_line(2, json.dumps(make_result('Gamma'))[:40], finish_reason='length'),
+            batch_line(4, 'not a JSON answer')
+        ])
+        statuses = iter(['in_progress', 'completed'])
+        self.analyzer.client = SimpleNamespace(
+            batches=SimpleNamespace(retrieve=lambda batch_id: SimpleNamespace(status=next(statuses), output_file_id='file-out')),
+            files=SimpleNamespace(content=lambda file_id: SimpleNamespace(text=output))
+        )
+        job_texts = [f'Posting {name} jobs@fallback{i}.com' for i, name in enumerate(['A', 'B', 'C', 'D', 'E'])]
+
+        results = self.analyzer.poll_batch('batch-1', job_texts, interval=0)
+
+        self.assertEqual([result['company'] for result in results],
+                         ['Alpha', 'Fallback1', 'Fallback2', 'Delta', 'Fallback4'])
+        cached = [self.analyzer._cache_get(job_text) is not None for job_text in job_texts]
+        self.assertEqual(cached, [True, False, False, True, False])
+
+    def test_submit_empty_batch_is_rejected(self):
+        """Test that an empty batch is rejected before anything is uploaded."""
+        with self.assertRaises(ValueError):
+            self.analyzer.submit_batch([])
+
+    def test_fallback_without_version_keywords(self):
+        """Test that a config without version_keywords falls back to FAANG when the API fails."""
+        config_dir = Path(self.cache_dir) / 'config'
+        shutil.copytree(Path(__file__).parent.parent / 'config', config_dir)
+        cv_config = yaml.safe_load((config_dir / 'cv_config.yaml').read_text(encoding='utf-8'))
+        del cv_config['version_keywords']
+        (config_dir / 'cv_config.yaml').write_text(yaml.safe_dump(cv_config), encoding='utf-8')
+
+        analyzer = JobAnalyzer(ConfigManager(str(config_dir)))
+        self.addCleanup(analyzer.client.close)
+        analyzer.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+            create=mock.Mock(side_effect=RuntimeError('API down'))
+        )))
+
+        self.assertEqual(analyzer.analyze_job_posting('Python developer for games')['version'], 'FAANG')
+
+    def test_large_batch_is_split_into_requests(self):
+        """Test that a large batch is sent in chunks of at most MAX_BATCH_SIZE postings."""
+        job_texts = [f'Posting number {i} for a data engineer' for i in range(23)]
+        results = self.analyzer.analyze_job_postings_batch(job_texts)
+
+        self.assertEqual(len(self.completions.calls), 3)
+        limit = job_analyzer.MAX_BATCH_SIZE * job_analyzer.MAX_TOKENS_PER_POSTING
+        self.assertTrue(all(call['max_tokens'] <= limit for call in self.completions.calls))
+        self.assertEqual(len(results), 23)
+        self.assertTrue(all(result['company'].startswith('Company') for result in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests for text helpers in utils."""
+import unittest
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import detect_language, extract_company_from_email, parse_ai_batch_response, parse_ai_response
+
+
+class TestUtils(unittest.TestCase):
+    """Test AI response parsing and company/language detection."""
+
+    def test_parse_json_response(self):
+        """Test that a JSON-mode response is normalized to the result shape."""
+        result = parse_ai_response('{"company": "Acme", "role": "Dev", "version": "FAANG", '
+                                   '"confidence": "high", "keywords": "python, sql", "ats_text": "Text."}')
+        self.assertEqual(result['company'], 'Acme')
+        self.assertEqual(result['confidence'], 0.5)
+        self.assertEqual(result['keywords'], ['python', 'sql'])
+
+    def test_parse_json_non_list_keywords(self):
+        """Test that keywords that are neither a list nor a string are dropped."""
+        result = parse_ai_response('{"company": "Acme", "keywords": 5}')
+        self.assertEqual(result['keywords'], [])
+
+    def test_parse_unparseable_response(self):
+        """Test that truncated JSON, which has no labels either, parses to None."""
+        self.assertIsNone(parse_ai_response('{"company": "Acme", "keywords": ["pyth'))
+        self.assertEqual(parse_ai_batch_response('{"jobs": [{"company": "Ac', 2), [None, None])
+
+    def test_parse_text_response_fallback(self):
+        """Test that a non-JSON response is parsed as LABEL: value lines."""
+        result = parse_ai_response('COMPANY: Acme\nCONFIDENCE: 0.8\nKEYWORDS: a, b\nATS_TEXT: One\ntwo')
+        self.assertEqual(result['company'], 'Acme')
+        self.assertEqual(result['confidence'], 0.8)
+        self.assertEqual(result['keywords'], ['a', 'b'])
+        self.assertEqual(result['ats_text'], 'One two')
+
+    def test_parse_json_batch_response(self):
+        """Test that a short "jobs" list leaves missing postings as None."""
+        results = parse_ai_batch_response('{"jobs": [{"company": "Acme"}]}', 2)
+        self.assertEqual(results[0]['company'], 'Acme')
+        self.assertIsNone(results[1])
+
+    def test_parse_text_batch_response(self):
+        """Test that text blocks are placed by their JOB header and missing jobs are None."""
+        response = ('=== JOB 3 ===\nCOMPANY: Gamma\n---END---\n'
+                    '=== JOB 1 ===\nCOMPANY: Alpha\n---END---\n')
+        results = parse_ai_batch_response(response, 3)
+        self.assertEqual(results[0]['company'], 'Alpha')
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2]['company'], 'Gamma')
+
+    def test_company_from_email(self):
+        """Test that the company is taken from a non-generic email domain."""
+        self.assertEqual(extract_company_from_email('Apply at jobs@acme.io'), 'Acme')
+        self.assertEqual(extract_company_from_email('Contact jane@gmail.com'), '')
+
+    def test_company_from_url(self):
+        """Test that the company is taken from a website URL."""
+        self.assertEqual(extract_company_from_email('See https://www.globex.com/careers'), 'Globex')
+
+    def test_detect_language(self):
+        """Test Spanish and English detection, including words next to punctuation."""
+        self.assertEqual(detect_language('Buscamos ingeniero con experiencia, para el equipo.'), 'es')
+        self.assertEqual(detect_language('We are looking for an engineer with experience.'), 'en')
+
+
+if __name__ == '__main__':
+    unittest.main()